@@ -1,9 +1,6 @@
 from pathlib import Path
 
 import typer
-import yaml
-
-from cli.commands.schema import build_database_url, get_sorted_tables, write_config
 
 app = typer.Typer()
 
@@ -21,13 +18,15 @@ def build(
     ),
 ):
     """Re-inspect database schema and update katcha.yml with new tables."""
+    # schema imports SQLAlchemy, so load it only once build actually runs
+    from cli.commands.schema import build_database_url, get_sorted_tables, load_config, write_config
+
     if not config_file.exists():
         typer.echo(f"Error: Config file not found: {config_file}", err=True)
         typer.echo("Run 'katcha init <database_url>' first.", err=True)
         raise typer.Exit(1)
 
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_file)
 
     if "database" not in config:
         typer.echo("Error: No database configuration found in config file.", err=True)
@@ -38,23 +37,15 @@ def build(
     typer.echo(f"Inspecting database: {database_url}")
 
     sorted_tables = get_sorted_tables(database_url)
-    existing_schema = config.get("schema", {})
+    existing_schema = config.get("schema", {}) or {}
 
-    new_tables = []
-    schema = {}
-    for table in sorted_tables:
-        if table in existing_schema:
-            schema[table] = existing_schema[table]
-        else:
-            schema[table] = default_rows
-            new_tables.append(table)
+    db_tables = set(sorted_tables)
+    new_tables = [table for table in sorted_tables if table not in existing_schema]
+    removed_tables = [table for table in existing_schema if table not in db_tables]
 
+    schema = {table: existing_schema.get(table, default_rows) for table in sorted_tables}
     # Keep tables that were in config but no longer in DB
-    removed_tables = []
-    for table, rows in existing_schema.items():
-        if table not in schema:
-            schema[table] = rows
-            removed_tables.append(table)
+    schema.update((table, existing_schema[table]) for table in removed_tables)
 
     typer.echo(f"Found {len(sorted_tables)} tables in database")
     if new_tables:
@@ -2,8 +2,6 @@ from pathlib import Path
 
 import typer
 
-from cli.commands.schema import get_sorted_tables, parse_database_url, write_config
-
 app = typer.Typer()
 
 
@@ -22,6 +20,9 @@ def init(
     ),
 ):
     """Initialize katcha configuration by inspecting a database schema."""
+    # Imported here so that importing this module stays free of SQLAlchemy
+    from cli.commands.schema import get_sorted_tables, parse_database_url, write_config
+
     typer.echo(f"Inspecting database: {database_url}")
 
     sorted_tables = get_sorted_tables(database_url)
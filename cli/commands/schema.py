@@ -1,8 +1,72 @@
-from collections import defaultdict
-from graphlib import TopologicalSorter
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import defaultdict, deque
+from pathlib import Path
 from urllib.parse import urlparse
 
+import yaml
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.pool import StaticPool
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+__all__ = [
+    "build_database_url",
+    "build_dependency_graph",
+    "get_engine",
+    "get_sorted_tables",
+    "inspect_database",
+    "load_config",
+    "parse_database_url",
+    "topological_sort",
+    "write_config",
+]
+
+CONFIG_CACHE_DIR = Path("~/.cache/katcha").expanduser()
+
+
+def load_config(path) -> dict:
+    """Load a katcha.yml config, reusing a cached parse if the file is unchanged.
+
+    The parsed config is pickled under CONFIG_CACHE_DIR, keyed by the file's
+    mtime and size.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cache_file = CONFIG_CACHE_DIR / f"{hashlib.blake2b(str(path).encode()).hexdigest()[:16]}.pkl"
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, config = pickle.load(f)
+        if cached_key == key:
+            return config
+    except Exception:
+        pass  # Missing, unreadable or malformed cache, parse the file
+
+    with open(path) as f:
+        config = yaml.load(f, Loader=YamlLoader)
+
+    # Caching is best-effort
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CONFIG_CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return config
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((key, config), f)
+        os.replace(tmp_path, cache_file)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+
+    return config
 
 
 def parse_database_url(database_url: str) -> dict:
@@ -30,23 +94,32 @@ def build_database_url(db_config: dict) -> str:
         return f"{engine}://{host}"
 
 
+@functools.lru_cache(maxsize=8)
+def get_engine(database_url: str):
+    """Get a shared engine for the given database URL."""
+    if database_url.startswith("sqlite"):
+        # The CLI runs on a single thread, so one connection is enough
+        return create_engine(database_url, poolclass=StaticPool)
+    return create_engine(database_url, pool_use_lifo=True, pool_pre_ping=True)
+
+
 def inspect_database(database_url: str):
     """Create an inspector for the given database URL."""
-    engine = create_engine(database_url)
-    return inspect(engine)
+    return inspect(get_engine(database_url))
 
 
-def build_dependency_graph(inspector) -> dict[str, set[str]]:
+def build_dependency_graph(all_foreign_keys: dict, tables: list[str]) -> dict[str, set[str]]:
     """Build a dependency graph from foreign key relationships.
 
+    Takes the result of inspector.get_multi_foreign_keys(), keyed by
+    (schema, table_name), so callers can share one reflection pass.
     Returns a dict mapping table_name -> set of tables it depends on.
     """
     graph = defaultdict(set)
-    tables = inspector.get_table_names()
 
     for table in tables:
         graph[table]  # Ensure all tables are in the graph
-        foreign_keys = inspector.get_foreign_keys(table)
+        foreign_keys = all_foreign_keys.get((None, table), [])
         for fk in foreign_keys:
             referred_table = fk["referred_table"]
             if referred_table and referred_table != table:  # Skip self-references
@@ -61,33 +134,47 @@ def topological_sort(graph: dict[str, set[str]]) -> list[str]:
     Tables with no dependencies come first, followed by tables
     that depend on them.
     """
-    sorter = TopologicalSorter(graph)
-    return list(sorter.static_order())
+    in_degree = {table: 0 for table in graph}
+    dependents = defaultdict(list)
+    for table, dependencies in graph.items():
+        in_degree[table] = len(dependencies)
+        for dependency in dependencies:
+            in_degree.setdefault(dependency, 0)  # Referenced tables may not be keys
+            dependents[dependency].append(table)
+
+    ready = deque(table for table, degree in in_degree.items() if degree == 0)
+    order = []
+    while ready:
+        table = ready.popleft()
+        order.append(table)
+        for dependent in dependents[table]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) < len(in_degree):
+        cycle = sorted(table for table, degree in in_degree.items() if degree > 0)
+        raise ValueError(f"Foreign key cycle between tables: {', '.join(cycle)}")
+    return order
 
 
 def get_sorted_tables(database_url: str) -> list[str]:
     """Get topologically sorted table names from a database."""
     inspector = inspect_database(database_url)
-    graph = build_dependency_graph(inspector)
+    graph = build_dependency_graph(inspector.get_multi_foreign_keys(), inspector.get_table_names())
     return topological_sort(graph)
 
 
 def write_config(config: dict, path) -> None:
     """Write config to file with blank lines between sections."""
-    import yaml
-
-    lines = []
-    lines.append(f"version: {config['version']}")
-    lines.append("")
-
-    lines.append("database:")
-    for key, value in config["database"].items():
-        lines.append(f"  {key}: {value}")
-    lines.append("")
+    with open(path, "w") as f:
+        write = f.write
+        write(f"version: {config['version']}\n\n")
 
-    lines.append("schema:")
-    for table, rows in config["schema"].items():
-        lines.append(f"  {table}: {rows}")
+        write("database:\n")
+        for key, value in config["database"].items():
+            write(f"  {key}: {value}\n")
 
-    with open(path, "w") as f:
-        f.write("\n".join(lines) + "\n")
+        write("\nschema:\n")
+        for table, rows in config["schema"].items():
+            write(f"  {table}: {rows}\n")
@@ -1,10 +1,11 @@
+import itertools
 import random
+from functools import partial
 from pathlib import Path
+from typing import Any, Callable, Iterator
 
 import typer
-import yaml
-from faker import Faker
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import bindparam, column, func, inspect, select, table, values
 from sqlalchemy.types import (
     BigInteger,
     Boolean,
@@ -19,136 +20,249 @@ from sqlalchemy.types import (
     Time,
 )
 
-from cli.commands.schema import build_database_url, build_dependency_graph, topological_sort
+from cli.commands.schema import (
+    build_database_url,
+    build_dependency_graph,
+    get_engine,
+    load_config,
+    topological_sort,
+)
 
 app = typer.Typer()
-fake = Faker()
-
-def get_faker_value(column_name: str, column_type, nullable: bool):
-    """Generate a fake value based on column name and type."""
-    if nullable and random.random() < 0.1:
-        return None
-
-    name_lower = column_name.lower()
 
-    # Name-based heuristics (more specific matches first)
-    if "email" in name_lower:
-        return fake.email()
-    if "phone" in name_lower or "mobile" in name_lower or "tel" in name_lower:
-        return fake.phone_number()[:20]
-    if name_lower in ("first_name", "firstname", "fname"):
-        return fake.first_name()
-    if name_lower in ("last_name", "lastname", "lname", "surname"):
-        return fake.last_name()
-    if name_lower in ("name", "full_name", "fullname", "username"):
-        return fake.name()
-    if "address" in name_lower:
-        return fake.address().replace("\n", ", ")
-    if "city" in name_lower:
-        return fake.city()
-    if "state" in name_lower or "province" in name_lower:
-        return fake.state()
-    if "country" in name_lower:
-        return fake.country()
-    if "zip" in name_lower or "postal" in name_lower:
-        return fake.postcode()
-    if "url" in name_lower or "website" in name_lower or "link" in name_lower:
-        return fake.url()
-    if "ip" in name_lower and "address" in name_lower:
-        return fake.ipv4()
-    if name_lower == "ip" or name_lower.endswith("_ip"):
-        return fake.ipv4()
-    if "description" in name_lower or "desc" in name_lower:
-        return fake.paragraph()
-    if "title" in name_lower:
-        return fake.sentence(nb_words=4).rstrip(".")
-    if "company" in name_lower or "organization" in name_lower:
-        return fake.company()
-    if "uuid" in name_lower or "guid" in name_lower:
-        return str(fake.uuid4())
-    if "password" in name_lower or "hash" in name_lower:
-        return fake.sha256()
-    if "token" in name_lower or "secret" in name_lower:
-        return fake.sha1()
-    if "slug" in name_lower:
-        return fake.slug()
-    if "color" in name_lower or "colour" in name_lower:
-        return fake.hex_color()
-    if "domain" in name_lower:
-        return fake.domain_name()
-    if "created_at" in name_lower or "updated_at" in name_lower or "last_login" in name_lower:
-        return fake.date_time()
-    if name_lower.endswith("_on") or name_lower.endswith("_at"):
-        return fake.date_time()
-    if "score" in name_lower or "rating" in name_lower:
-        return round(fake.pyfloat(min_value=0, max_value=100), 2)
-    if "discount" in name_lower:
-        return round(random.uniform(0, 0.5), 2)  # 0-50% discount
-    if "quantity" in name_lower:
-        return fake.random_int(min=1, max=100)
-    if "price" in name_lower or "cost" in name_lower or "amount" in name_lower:
-        return round(fake.pyfloat(min_value=1, max_value=1000), 2)
-    if "count" in name_lower:
-        return fake.random_int(min=0, max=1000)
-    if "version" in name_lower:
-        return fake.random_int(min=1, max=10)
-    if "serial" in name_lower:
-        return fake.hexify(text="^^^^^^^^^^^^^^^^")
-    if "subject" in name_lower or "issuer" in name_lower:
-        return fake.company()
-    if "algorithm" in name_lower:
-        return random.choice(["RSA", "ECDSA", "SHA256", "SHA384", "SHA512"])
-    if "public_key" in name_lower or "key" in name_lower:
-        return fake.sha256()
-    if "status" in name_lower:
-        return random.choice(["active", "inactive", "pending", "completed"])
-    if "role" in name_lower:
-        return random.choice(["admin", "user", "guest", "moderator"])
-    if "type" in name_lower:
-        return fake.word()
-    if name_lower.endswith("id") and "uuid" not in name_lower:
-        # ID columns that aren't UUIDs - generate short alphanumeric codes
-        return fake.bothify(text="???##").upper()
-
-    # Type-based fallbacks - check both class and string representation
+# Rows sent to the database per executemany call
+BATCH_SIZE = 1000
+
+# Generators below are either the name of a Faker method, or a function taking
+# the Faker instance; resolve_generator binds them to the instance in use.
+
+# Exact column-name matches, checked before the substring rules
+EXACT_NAME_GENERATORS = {
+    "first_name": "first_name",
+    "firstname": "first_name",
+    "fname": "first_name",
+    "last_name": "last_name",
+    "lastname": "last_name",
+    "lname": "last_name",
+    "surname": "last_name",
+    "name": "name",
+    "full_name": "name",
+    "fullname": "name",
+    "username": "name",
+    "ip": "ipv4",
+}
+
+# Name-based heuristics as (substrings, suffixes, generator), more specific matches first
+NAME_RULES = [
+    (("email",), (), "email"),
+    (("phone", "mobile", "tel"), (), lambda fake: fake.phone_number()[:20]),
+    (("address",), (), lambda fake: fake.address().replace("\n", ", ")),
+    (("city",), (), "city"),
+    (("state", "province"), (), "state"),
+    (("country",), (), "country"),
+    (("zip", "postal"), (), "postcode"),
+    (("url", "website", "link"), (), "url"),
+    ((), ("_ip",), "ipv4"),
+    (("description", "desc"), (), "paragraph"),
+    (("title",), (), lambda fake: fake.sentence(nb_words=4).rstrip(".")),
+    (("company", "organization"), (), "company"),
+    (("uuid", "guid"), (), lambda fake: str(fake.uuid4())),
+    (("password", "hash"), (), "sha256"),
+    (("token", "secret"), (), "sha1"),
+    (("slug",), (), "slug"),
+    (("color", "colour"), (), "hex_color"),
+    (("domain",), (), "domain_name"),
+    (("created_at", "updated_at", "last_login"), ("_on", "_at"), "date_time"),
+    (("score", "rating"), (), lambda fake: round(fake.pyfloat(min_value=0, max_value=100), 2)),
+    (("discount",), (), lambda fake: round(random.uniform(0, 0.5), 2)),  # 0-50% discount
+    (("quantity",), (), lambda fake: fake.random_int(min=1, max=100)),
+    (("price", "cost", "amount"), (), lambda fake: round(fake.pyfloat(min_value=1, max_value=1000), 2)),
+    (("count",), (), lambda fake: fake.random_int(min=0, max=1000)),
+    (("version",), (), lambda fake: fake.random_int(min=1, max=10)),
+    (("serial",), (), lambda fake: fake.hexify(text="^^^^^^^^^^^^^^^^")),
+    (("subject", "issuer"), (), "company"),
+    (("algorithm",), (), lambda fake: random.choice(["RSA", "ECDSA", "SHA256", "SHA384", "SHA512"])),
+    (("public_key", "key"), (), "sha256"),
+    (("status",), (), lambda fake: random.choice(["active", "inactive", "pending", "completed"])),
+    (("role",), (), lambda fake: random.choice(["admin", "user", "guest", "moderator"])),
+    (("type",), (), "word"),
+    # ID columns that aren't UUIDs - generate short alphanumeric codes
+    ((), ("id",), lambda fake: fake.bothify(text="???##").upper()),
+]
+
+ValueGenerator = Callable[[], Any]
+BulkGenerator = Callable[[int], list]
+
+def random_ints(n: int) -> list[int]:
+    """Generate n integers between 1 and 10000."""
+    return random.choices(range(1, 10001), k=n)
+
+def random_floats(n: int) -> list[float]:
+    """Generate n floats between 0 and 10000, rounded to 2 places."""
+    uniform = random.uniform
+    return [round(uniform(0, 10000), 2) for _ in range(n)]
+
+def random_bools(n: int) -> list[bool]:
+    """Generate n booleans."""
+    return random.choices((True, False), k=n)
+
+def bulk_from(generator: ValueGenerator) -> BulkGenerator:
+    """Wrap a single-value generator so it produces n values per call."""
+    def bulk(n: int) -> list:
+        return [generator() for _ in range(n)]
+    return bulk
+
+def get_type_generator(column_type, fake) -> BulkGenerator:
+    """Pick a bulk generator from the column type when no name heuristic matches."""
+    # Check both class and string representation
     type_class = type(column_type)
     type_str = str(column_type).upper()
 
     # UUID type detection (PostgreSQL UUID, or CHAR(36)/VARCHAR(36) for UUID storage)
     if "UUID" in type_str:
-        return str(fake.uuid4())
+        return bulk_from(lambda: str(fake.uuid4()))
     if type_class in (Integer, SmallInteger, BigInteger) or "INT" in type_str:
-        return fake.random_int(min=1, max=10000)
+        return random_ints
     if type_class in (Float, Numeric) or "FLOAT" in type_str or "NUMERIC" in type_str or "DECIMAL" in type_str or "REAL" in type_str:
-        return round(fake.pyfloat(min_value=0, max_value=10000), 2)
+        return random_floats
     if type_class == Boolean or "BOOL" in type_str:
-        return fake.boolean()
+        return random_bools
     if type_class == Date or type_str == "DATE":
-        return fake.date_object()
+        return bulk_from(fake.date_object)
     if type_class == DateTime or "DATETIME" in type_str or "TIMESTAMP" in type_str:
-        return fake.date_time()
+        return bulk_from(fake.date_time)
     if type_class == Time or type_str == "TIME":
-        return fake.time_object()
+        return bulk_from(fake.time_object)
     if "JSON" in type_str:
-        return None  # JSON columns often need specific structure
+        return lambda n: [None] * n  # JSON columns often need specific structure
     if type_class == Text or "TEXT" in type_str:
-        return fake.paragraph()
+        return bulk_from(fake.paragraph)
     if type_class == String or "VARCHAR" in type_str or "CHAR" in type_str:
         length = getattr(column_type, "length", None) or 255
         # CHAR(36) or VARCHAR(36) is commonly used for UUID storage
         if length == 36:
-            return str(fake.uuid4())
-        generated = fake.text(max_nb_chars=min(length, 200))
-        return generated[:length]
+            return bulk_from(lambda: str(fake.uuid4()))
+        max_chars = min(length, 200)
+        return bulk_from(lambda: fake.text(max_nb_chars=max_chars)[:length])
 
     # Default fallback
-    return fake.word()
+    return bulk_from(fake.word)
+
+def resolve_generator(column_name: str, column_type, fake) -> BulkGenerator:
+    """Pick a fake value generator for a column, producing n values per call."""
+    name_lower = column_name.lower()
+    rule = EXACT_NAME_GENERATORS.get(name_lower)
+    if rule is None:
+        for substrings, suffixes, rule_generator in NAME_RULES:
+            if name_lower.endswith(suffixes) or any(s in name_lower for s in substrings):
+                rule = rule_generator
+                break
+
+    if rule is None:
+        return get_type_generator(column_type, fake)
+    if isinstance(rule, str):
+        return bulk_from(getattr(fake, rule))
+    return bulk_from(partial(rule, fake))
+
+def create_faker(random_seed: int | None = None):
+    """Create the Faker instance used for a seed run.
+
+    Faker is imported here rather than at module level because loading its
+    providers is slow and only the seed command needs them. Passing
+    random_seed makes the generated data reproducible.
+    """
+    from faker import Faker
+
+    fake = Faker(use_weighting=False)
+    if random_seed is not None:
+        fake.seed_instance(random_seed)
+        random.seed(random_seed)
+    return fake
+
+def generate_forever(bulk_generator: BulkGenerator, chunk_size: int) -> Iterator:
+    """Yield fake values, produced chunk_size at a time."""
+    while True:
+        yield from bulk_generator(chunk_size)
+
+def unique_values(stream: Iterator, count: int) -> Iterator:
+    """Yield distinct values from a stream for unique/PK columns.
+
+    Draws twice the needed count upfront and deduplicates it once, then
+    falls back to suffixed values if more are requested.
+    """
+    distinct = list(dict.fromkeys(itertools.islice(stream, count * 2)))
+    yield from distinct
+    base = next(stream)
+    for i in itertools.count(len(distinct)):
+        yield f"{base}_{i}"
+
+def get_driver_insert(dialect, tbl, column_names: list[str]) -> tuple[str, list[str], list] | None:
+    """Build a plain DBAPI INSERT for cursor.executemany.
+
+    Returns:
+        (sql, column_names, bind_processors), or None when the Core insert
+        should be used instead
+    """
+    if dialect.use_insertmanyvalues_wo_returning:
+        return None  # SQLAlchemy already batches into multi-row VALUES (e.g. psycopg2)
+    marker = {"qmark": "?", "format": "%s"}.get(dialect.paramstyle)
+    if marker is None:
+        return None
 
-def get_table_columns(inspector, table_name: str) -> list[dict]:
-    """Get column information for a table."""
-    return inspector.get_columns(table_name)
+    preparer = dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(name) for name in column_names)
+    placeholders = ", ".join([marker] * len(column_names))
+    sql = f"INSERT INTO {preparer.format_table(tbl)} ({columns}) VALUES ({placeholders})"
+    processors = [tbl.c[name].type.dialect_impl(dialect).bind_processor(dialect) for name in column_names]
+    return sql, column_names, processors
 
-def get_foreign_keys(inspector, table_name: str) -> tuple[dict[str, tuple[str, str]], dict[str, tuple[str, str]]]:
+def insert_batch(conn, insert_stmt, driver_insert, batch: list[dict]) -> list:
+    """Insert a batch of rows, through the DBAPI cursor when possible.
+
+    Returns:
+        Values from the insert's RETURNING clause, or an empty list
+    """
+    if driver_insert is None:
+        result = conn.execute(insert_stmt, batch)
+        return result.scalars().all() if result.returns_rows else []
+
+    sql, column_names, processors = driver_insert
+    params = [
+        tuple(
+            value if process is None else process(value)
+            for value, process in zip((row[name] for name in column_names), processors)
+        )
+        for row in batch
+    ]
+    conn.exec_driver_sql(sql, params)
+    return []
+
+def update_self_refs(conn, tbl, pk_col_name: str, self_ref_col: str, pairs: list[tuple]) -> None:
+    """Point self-referential FKs at other rows, given (pk_value, ref_value) pairs."""
+    pk_col = tbl.c[pk_col_name]
+    if conn.dialect.name == "postgresql":
+        # One UPDATE ... FROM (VALUES ...) statement for the whole batch
+        ref_values = values(
+            column("pk_val", pk_col.type), column("ref_val", tbl.c[self_ref_col].type), name="ref_values"
+        ).data(pairs)
+        conn.execute(
+            tbl.update()
+            .where(pk_col == ref_values.c.pk_val)
+            .values({self_ref_col: ref_values.c.ref_val})
+        )
+    else:
+        update_stmt = (
+            tbl.update()
+            .where(pk_col == bindparam("pk_val"))
+            .values({self_ref_col: bindparam("ref_val")})
+        )
+        conn.execute(update_stmt, [{"pk_val": pk_value, "ref_val": ref_value} for pk_value, ref_value in pairs])
+
+def get_table_columns(all_columns: dict, table_name: str) -> list[dict]:
+    """Get column information for a table from batched reflection results."""
+    return all_columns.get((None, table_name), [])
+
+def get_foreign_keys(all_foreign_keys: dict, table_name: str) -> tuple[dict[str, tuple[str, str]], dict[str, tuple[str, str]]]:
     """Get foreign key mappings: local_column -> (referred_table, referred_column).
 
     Returns:
@@ -156,7 +270,7 @@ def get_foreign_keys(inspector, table_name: str) -> tuple[dict[str, tuple[str, s
     """
     fk_map = {}
     self_ref_map = {}
-    for fk in inspector.get_foreign_keys(table_name):
+    for fk in all_foreign_keys.get((None, table_name), []):
         for local_col, referred_col in zip(fk["constrained_columns"], fk["referred_columns"]):
             if fk["referred_table"] == table_name:
                 self_ref_map[local_col] = (fk["referred_table"], referred_col)
@@ -164,19 +278,24 @@ def get_foreign_keys(inspector, table_name: str) -> tuple[dict[str, tuple[str, s
                 fk_map[local_col] = (fk["referred_table"], referred_col)
     return fk_map, self_ref_map
 
-def get_primary_keys(inspector, table_name: str) -> set[str]:
+def get_primary_keys(all_pk_constraints: dict, table_name: str) -> set[str]:
     """Get primary key column names for a table."""
-    pk = inspector.get_pk_constraint(table_name)
+    pk = all_pk_constraints.get((None, table_name)) or {}
     return set(pk.get("constrained_columns", []))
 
-def get_unique_columns(inspector, table_name: str) -> set[str]:
+def get_unique_columns(all_indexes: dict, table_name: str) -> set[str]:
     """Get columns that have unique constraints."""
     unique_cols = set()
-    for idx in inspector.get_indexes(table_name):
+    for idx in all_indexes.get((None, table_name), []):
         if idx.get("unique"):
             unique_cols.update(idx.get("column_names", []))
     return unique_cols
 
+def sample_forever(population: list, chunk_size: int) -> Iterator:
+    """Yield random picks from population, drawn chunk_size at a time."""
+    while True:
+        yield from random.choices(population, k=chunk_size)
+
 @app.command()
 def seed(
     config_file: Path = typer.Option(
@@ -184,6 +303,12 @@ def seed(
         "--config", "-c",
         help="Path to katcha.yml config file"
     ),
+    random_seed: int | None = typer.Option(
+        None,
+        "--seed", "-s",
+        envvar="KATCHA_SEED",
+        help="Random seed for reproducible data"
+    ),
 ):
     """Seed the database with fake data based on katcha.yml configuration."""
     if not config_file.exists():
@@ -191,15 +316,14 @@ def seed(
         typer.echo("Run 'katcha init <database_url>' first.", err=True)
         raise typer.Exit(1)
 
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_file)
 
     if "database" not in config:
         typer.echo("Error: No database configuration found.", err=True)
         raise typer.Exit(1)
 
     database_url = build_database_url(config["database"])
-    engine = create_engine(database_url)
+    engine = get_engine(database_url)
     inspector = inspect(engine)
 
     schema = config.get("schema", {})
@@ -207,29 +331,40 @@ def seed(
         typer.echo("Error: No schema defined in config.", err=True)
         raise typer.Exit(1)
 
+    # Reflect every table in one batch; the results are shared by the
+    # dependency graph and the per-table seeding below
+    table_names = inspector.get_table_names()
+    all_columns = inspector.get_multi_columns()
+    all_foreign_keys = inspector.get_multi_foreign_keys()
+    all_pk_constraints = inspector.get_multi_pk_constraint()
+    all_indexes = inspector.get_multi_indexes()
+
     # Build dependency graph and sort tables
-    graph = build_dependency_graph(inspector)
+    graph = build_dependency_graph(all_foreign_keys, table_names)
     sorted_tables = topological_sort(graph)
 
     # Filter to only tables in config that exist in DB
-    db_tables = set(inspector.get_table_names())
+    db_tables = set(table_names)
     tables_to_seed = [t for t in sorted_tables if t in schema and t in db_tables]
 
+    fake = create_faker(random_seed)
+
     # Track inserted PKs for foreign key references
     inserted_pks: dict[str, list] = {}
 
     typer.echo(f"Seeding {len(tables_to_seed)} tables...")
 
-    with engine.connect() as conn:
+    # Seed everything in one transaction; PKs are tracked in-process for FK values
+    with engine.begin() as conn:
         for table_name in tables_to_seed:
             row_count = schema[table_name]
             if row_count <= 0:
                 continue
 
-            columns = get_table_columns(inspector, table_name)
-            foreign_keys, self_ref_fks = get_foreign_keys(inspector, table_name)
-            primary_keys = get_primary_keys(inspector, table_name)
-            unique_columns = get_unique_columns(inspector, table_name)
+            columns = get_table_columns(all_columns, table_name)
+            foreign_keys, self_ref_fks = get_foreign_keys(all_foreign_keys, table_name)
+            primary_keys = get_primary_keys(all_pk_constraints, table_name)
+            unique_columns = get_unique_columns(all_indexes, table_name)
 
             # Check if this is a composite PK (junction table)
             is_composite_pk = len(primary_keys) > 1
@@ -248,19 +383,60 @@ def seed(
 
             inserted_pks[table_name] = []
 
-            # Track used values for unique columns
-            used_unique_values: dict[str, set] = {col: set() for col in unique_columns}
+            # Build the insert once per table; every row uses the same columns
+            tbl = table(table_name, *(column(col["name"], col["type"]) for col in columns))
+            insert_stmt = tbl.insert()
+            row_columns = [col["name"] for col in insertable_columns]
+            # Recover auto-increment PKs with INSERT ... RETURNING where supported
+            returning_pk = auto_pk_col is not None and conn.dialect.insert_executemany_returning
+            if returning_pk:
+                insert_stmt = insert_stmt.returning(tbl.c[auto_pk_col])
+                driver_insert = None
+            else:
+                if auto_pk_col:
+                    # Assign auto-increment PKs client-side so rows can be batched
+                    row_columns.append(auto_pk_col)
+                    max_pk = conn.execute(select(func.max(tbl.c[auto_pk_col]))).scalar()
+                    next_pk = (max_pk or 0) + 1
+                driver_insert = get_driver_insert(conn.dialect, tbl, row_columns)
+            batch: list[dict] = []
 
             # Track used composite PK combinations
             used_pk_combinations: set[tuple] = set()
 
-            # For unique FK columns, we need available (unused) PKs from referenced table
-            available_fk_pks: dict[str, list] = {}
-            for col_name in foreign_keys:
-                if col_name in unique_columns:
+            # Classify each column once per table; the row loop only draws values.
+            # Each entry is (name, kind, source, nullable), where source feeds the values.
+            plan = []
+            # Draw values one batch at a time so memory stays flat for large tables
+            chunk_size = min(row_count, BATCH_SIZE)
+            for col in insertable_columns:
+                col_name = col["name"]
+                is_pk_col = col_name in primary_keys
+                # PK columns are never nullable
+                nullable = col.get("nullable", True) and not is_pk_col
+
+                if col_name in self_ref_fks:
+                    # Set to NULL first, update later
+                    plan.append((col_name, "self_ref", None, nullable))
+                elif col_name in foreign_keys:
                     ref_table, _ = foreign_keys[col_name]
-                    if ref_table in inserted_pks:
-                        available_fk_pks[col_name] = list(inserted_pks[ref_table])
+                    ref_pks = inserted_pks.get(ref_table)
+                    if col_name in unique_columns and not is_pk_col:
+                        # Unique FKs take each referenced PK at most once, in random order
+                        available = random.sample(ref_pks, len(ref_pks)) if ref_pks else []
+                        plan.append((col_name, "unique_fk", iter(available), nullable))
+                    else:
+                        # Non-unique FKs (or part of a composite PK) draw referenced PKs in bulk
+                        sampler = sample_forever(ref_pks, chunk_size) if ref_pks else None
+                        plan.append((col_name, "fk", sampler, nullable))
+                else:
+                    stream = generate_forever(resolve_generator(col_name, col["type"], fake), chunk_size)
+                    if col_name in unique_columns or is_pk_col:
+                        plan.append((col_name, "unique", unique_values(stream, row_count), nullable))
+                    else:
+                        plan.append((col_name, "plain", stream, nullable))
+            pk_order = sorted(primary_keys)
+            rand = random.random
 
             for _ in range(row_count):
                 row_data = {}
@@ -271,58 +447,32 @@ def seed(
                 for attempt in range(max_attempts):
                     row_data = {}
 
-                    for col in insertable_columns:
-                        col_name = col["name"]
-                        col_type = col["type"]
-                        # PK columns are never nullable
-                        is_pk_col = col_name in primary_keys
-                        nullable = col.get("nullable", True) and not is_pk_col
-
-                        # Handle self-referential FKs - set to NULL first, update later
-                        if col_name in self_ref_fks:
-                            row_data[col_name] = None
-                        # Handle regular foreign keys
-                        elif col_name in foreign_keys:
-                            ref_table, ref_col = foreign_keys[col_name]
-
-                            # Check if this FK has a unique constraint (but not part of composite PK)
-                            if col_name in unique_columns and col_name not in primary_keys:
-                                if col_name in available_fk_pks and available_fk_pks[col_name]:
-                                    row_data[col_name] = available_fk_pks[col_name].pop(0)
-                                elif nullable:
-                                    row_data[col_name] = None
-                                else:
-                                    break
+                    for col_name, kind, source, nullable in plan:
+                        if kind == "plain":
+                            row_data[col_name] = None if nullable and rand() < 0.1 else next(source)
+                        elif kind == "unique":
+                            row_data[col_name] = next(source)
+                        elif kind == "fk":
+                            if source is not None:
+                                row_data[col_name] = next(source)
+                            elif nullable:
+                                row_data[col_name] = None
                             else:
-                                # Non-unique FK or part of composite PK
-                                if ref_table in inserted_pks and inserted_pks[ref_table]:
-                                    row_data[col_name] = random.choice(inserted_pks[ref_table])
-                                elif nullable:
-                                    row_data[col_name] = None
-                                else:
-                                    row_data[col_name] = 1  # Fallback
-                        elif col_name in unique_columns or is_pk_col:
-                            # Generate unique value for unique/PK columns
-                            track_key = col_name
-                            if track_key not in used_unique_values:
-                                used_unique_values[track_key] = set()
-                            for _ in range(100):
-                                value = get_faker_value(col_name, col_type, nullable=False)
-                                if value not in used_unique_values[track_key]:
-                                    used_unique_values[track_key].add(value)
-                                    row_data[col_name] = value
-                                    break
+                                row_data[col_name] = 1  # Fallback
+                        elif kind == "unique_fk":
+                            ref_pk = next(source, None)
+                            if ref_pk is not None:
+                                row_data[col_name] = ref_pk
+                            elif nullable:
+                                row_data[col_name] = None
                             else:
-                                base = get_faker_value(col_name, col_type, nullable=False)
-                                value = f"{base}_{len(used_unique_values[track_key])}"
-                                used_unique_values[track_key].add(value)
-                                row_data[col_name] = value
-                        else:
-                            row_data[col_name] = get_faker_value(col_name, col_type, nullable)
+                                break
+                        else:  # self_ref
+                            row_data[col_name] = None
 
                     # For composite PKs, check if combination is unique
                     if is_composite_pk and row_data:
-                        pk_combo = tuple(row_data.get(pk) for pk in sorted(primary_keys))
+                        pk_combo = tuple(row_data.get(pk) for pk in pk_order)
                         if pk_combo not in used_pk_combinations:
                             used_pk_combinations.add(pk_combo)
                             break  # Found unique combination
@@ -335,29 +485,26 @@ def seed(
                 if not row_data or len(row_data) < len(insertable_columns):
                     continue
 
-                # Build and execute insert (quote table name for spaces)
-                quoted_table = f'"{table_name}"' if " " in table_name else table_name
-                col_names = ", ".join(f'"{k}"' for k in row_data.keys())
-                placeholders = ", ".join(f":{k}" for k in row_data.keys())
-                sql = text(f"INSERT INTO {quoted_table} ({col_names}) VALUES ({placeholders})")
+                if auto_pk_col and not returning_pk:
+                    row_data[auto_pk_col] = next_pk
+                    next_pk += 1
 
-                result = conn.execute(sql, row_data)
-
-                # Track inserted PK for foreign key references
-                # For single INTEGER PKs, use lastrowid; for others, use the value from row_data
+                # Track inserted PK for foreign key references (RETURNING PKs are added on insert)
                 if len(primary_keys) == 1:
                     pk_col = list(primary_keys)[0]
                     if pk_col in row_data:
-                        # Non-autoincrement PK (TEXT or composite)
                         inserted_pks[table_name].append(row_data[pk_col])
-                    elif result.lastrowid:
-                        # Auto-increment INTEGER PK
-                        inserted_pks[table_name].append(result.lastrowid)
                 else:
                     # Composite PK - just track that we inserted a row
                     inserted_pks[table_name].append(True)
 
-            conn.commit()
+                batch.append(row_data)
+                if len(batch) >= BATCH_SIZE:
+                    inserted_pks[table_name].extend(insert_batch(conn, insert_stmt, driver_insert, batch))
+                    batch = []
+
+            if batch:
+                inserted_pks[table_name].extend(insert_batch(conn, insert_stmt, driver_insert, batch))
 
             # Second pass: update self-referential FKs
             if self_ref_fks and inserted_pks[table_name]:
@@ -372,19 +519,17 @@ def seed(
 
                 if pk_col_name:
                     for self_ref_col, (_, ref_col) in self_ref_fks.items():
+                        pairs = []
                         # Update ~50% of rows to reference other rows
                         rows_to_update = random.sample(pks, k=min(len(pks) // 2, len(pks)))
                         for pk_value in rows_to_update:
                             # Pick a different row to reference (avoid self-reference loops)
-                            other_pks = [p for p in pks if p != pk_value]
-                            if other_pks:
-                                ref_value = random.choice(other_pks)
-                                update_sql = text(
-                                    f'UPDATE {quoted_table} SET "{self_ref_col}" = :ref_val '
-                                    f'WHERE "{pk_col_name}" = :pk_val'
-                                )
-                                conn.execute(update_sql, {"ref_val": ref_value, "pk_val": pk_value})
-                    conn.commit()
+                            ref_value = random.choice(pks)
+                            while ref_value == pk_value:
+                                ref_value = random.choice(pks)
+                            pairs.append((pk_value, ref_value))
+                        for start in range(0, len(pairs), BATCH_SIZE):
+                            update_self_refs(conn, tbl, pk_col_name, self_ref_col, pairs[start:start + BATCH_SIZE])
 
             actual_rows = len(inserted_pks[table_name])
             if actual_rows < row_count: